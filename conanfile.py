@@ -1,8 +1,6 @@
 from conan import ConanFile
-from conan.tools.cmake import CMake, CMakeToolchain, CMakeDeps
-from conan.tools.files import copy
-from conan.errors import ConanException
-import os, shutil
+from conan.tools.cmake import CMake, CMakeToolchain, CMakeDeps, cmake_layout
+from conan.tools.cmake.utils import is_multi_configuration
 
 class StdxConan(ConanFile):
     name = "stdx"
@@ -12,75 +10,66 @@ class StdxConan(ConanFile):
     url = "https://github.com/yrezaei/stdx"
     description = "Collection of C++ modules"
     topics = ("logger", "flag", "utilities")
-    exports = "conanfile.py"
-    exports_sources = "*"
+    package_type = "library"
+    exports_sources = ("CMakeLists.txt", "modules/*", "include/*", "test_package/*.cxx", "conanfile.py")
+    # CMake builds out of source, so every package ID can share one source copy
+    no_copy_source = True
+    # Shared by layout() and generate() so folders match the single-config build
+    _cmake_generator = "Ninja"
     settings = "os", "compiler", "build_type", "arch"
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
-        "local_dev": [True, False],
         "enable_flag": [True, False],
         "enable_logger": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
-        "local_dev": False,
         "enable_flag": True,
         "enable_logger": True,
     }
-    dev_mode = False
 
     def configure(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
-        self.dev_mode = self.options.local_dev
+        if self.options.shared:
+            self.options.rm_safe("fPIC")
+        # Without the logger only headers are packaged
+        if not self.options.enable_logger:
+            self.package_type = "header-library"
+            self.options.rm_safe("shared")
+            self.options.rm_safe("fPIC")
+
+    def build_requirements(self):
+        self.tool_requires("ninja/[>=1.11]")
 
     def layout(self):
-        pass  # Layout can be configured if needed
-
-    def source(self):
-        # Check the local_dev option
-        if self.dev_mode:
-            self.output.info("Local development mode detected. Skipping download.")
-            # Ensure that source files exist in the current folder
-            if not os.path.exists(self.source_folder):
-                raise ConanException("Local source folder not found for development mode.")
-            return
-        self.output.info("Downloading source code...")
-        self.run("curl -L -o stdx-v{}.tar.gz https://github.com/yRezaei/stdx/archive/refs/tags/v{}.tar.gz".format(self.version, self.version))
-        self.run("tar -xzf stdx-v{}.tar.gz".format(self.version))
-        # Use shutil for moving files cross-platform
-        extracted_folder = "stdx-{}".format(self.version)
-        for item in os.listdir(extracted_folder):
-            s = os.path.join(extracted_folder, item)
-            d = os.path.join(self.source_folder, item)
-            if os.path.isdir(s):
-                shutil.move(s, d)
-            else:
-                shutil.move(s, d)
-        # Remove the extracted folder after moving its contents
-        shutil.rmtree(extracted_folder)
+        cmake_layout(self, generator=self._cmake_generator)
 
     def generate(self):
-        tc = CMakeToolchain(self)
-        tc.variables["CMAKE_BUILD_TYPE"] = str(self.settings.build_type)
+        shared = bool(self.options.get_safe("shared"))
+        enable_flag = bool(self.options.enable_flag)
+        enable_logger = bool(self.options.enable_logger)
+
+        tc = CMakeToolchain(self, generator=self._cmake_generator)
+        # A profile generator conf overrides Ninja; only emit the requested configuration
+        if is_multi_configuration(tc.generator):
+            tc.cache_variables["CMAKE_CONFIGURATION_TYPES"] = str(self.settings.build_type)
 
         # If user says -o stdx:shared=True, then set BUILD_SHARED_LIBS=ON
-        tc.cache_variables["BUILD_SHARED_LIBS"] = "ON" if self.options.shared else "OFF"
+        tc.cache_variables["BUILD_SHARED_LIBS"] = "ON" if shared else "OFF"
 
         # Pass module enable flags to CMake
-        tc.cache_variables["STDX_ENABLE_FLAG"] = \
-            "ON" if self.options.enable_flag else "OFF"
-        tc.cache_variables["STDX_ENABLE_LOGGER"] = \
-            "ON" if self.options.enable_logger else "OFF"
+        tc.cache_variables["STDX_ENABLE_FLAG"] = "ON" if enable_flag else "OFF"
+        tc.cache_variables["STDX_ENABLE_LOGGER"] = "ON" if enable_logger else "OFF"
 
         tc.generate()
 
-        # Generate CMakeDeps for each module
-        cd = CMakeDeps(self)
-        cd.generate()
-        cd.configuration = []
+        # Only generate CMakeDeps when there are dependencies to find
+        if list(self.dependencies.host.values()):
+            cd = CMakeDeps(self)
+            cd.generate()
 
     def build(self):
         cmake = CMake(self)
@@ -91,6 +80,37 @@ class StdxConan(ConanFile):
         cmake = CMake(self)
         cmake.install()
 
+    def package_id(self):
+        # Headers do not depend on the compiler or build type, but
+        # enable_flag still selects which of them are installed
+        if self.package_type == "header-library":
+            self.info.settings.clear()
+
     def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "stdx")
+        self.cpp_info.set_property("cmake_target_name", "stdx::stdx")
+
+        # Header-only utilities shared by every module (utils, concurrency)
+        core = self.cpp_info.components["core"]
+        core.set_property("cmake_target_name", "stdx::core")
+        core.libdirs = []
+        core.bindirs = []
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            core.system_libs = ["pthread"]
+
+        if self.options.enable_flag:
+            flag = self.cpp_info.components["flag"]
+            flag.set_property("cmake_target_name", "stdx::flag")
+            flag.libdirs = []
+            flag.bindirs = []
+            flag.requires = ["core"]
+
         if self.options.enable_logger:
-            self.cpp_info.libs.append("logger")
\ No newline at end of file
+            logger = self.cpp_info.components["logger"]
+            logger.set_property("cmake_target_name", "stdx::logger")
+            logger.libs = ["logger"]
+            logger.requires = ["core"]
+            if self.settings.os in ["Linux", "FreeBSD"]:
+                logger.system_libs = ["pthread"]
+            if self.options.get_safe("shared"):
+                logger.defines = ["STDX_USE_SHARED"]
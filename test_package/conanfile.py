@@ -30,11 +30,4 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if can_run(self):
-            stdx_options = self.dependencies["stdx"].options
-            self.run(os.path.join(self.cpp.build.bindir, "test_ring_buffer"), env="conanrun")
-            self.run(os.path.join(self.cpp.build.bindir, "test_thread_pool"), env="conanrun")
-            if stdx_options.enable_flag:
-                self.run(os.path.join(self.cpp.build.bindir, "test_flag"), env="conanrun")
-            if stdx_options.enable_logger:
-                self.run(os.path.join(self.cpp.build.bindir, "test_logger"), env="conanrun")
-            
+            self.run(os.path.join(self.cpp.build.bindir, "test_package"), env="conanrun")
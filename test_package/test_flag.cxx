@@ -134,10 +134,3 @@ TEST(FlagTests, EqualityOperators)
     EXPECT_TRUE(f_eq_1 == f_eq_2);
     EXPECT_TRUE(f_eq_1 != f_neq);
 }
-
-// Main entry point for Google Test
-int main(int argc, char** argv)
-{
-    ::testing::InitGoogleTest(&argc, argv);
-    return RUN_ALL_TESTS();
-}
@@ -234,10 +234,3 @@ TEST_F(LoggerTests, BufferedWritingMessageThreshold)
         validateLogFile(log_file_name_, "Buffered message #" + std::to_string(i));
     }
 }
-
-// Main entry point for Google Test
-int main(int argc, char **argv)
-{
-    ::testing::InitGoogleTest(&argc, argv);
-    return RUN_ALL_TESTS();
-}
@@ -0,0 +1,8 @@
+#include <gtest/gtest.h>
+
+// Single Google Test entry point shared by every test_*.cxx in test_package
+int main(int argc, char** argv)
+{
+    ::testing::InitGoogleTest(&argc, argv);
+    return RUN_ALL_TESTS();
+}
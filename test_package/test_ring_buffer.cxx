@@ -259,12 +259,3 @@ TEST(BoundedQueueTest, MultiProducerMultiConsumer)
 }
 
 } // namespace stdx
-
-//------------------------------------------------------------------------------
-// main: typical Google Test entry
-//------------------------------------------------------------------------------
-int main(int argc, char** argv)
-{
-    ::testing::InitGoogleTest(&argc, argv);
-    return RUN_ALL_TESTS();
-}
\ No newline at end of file
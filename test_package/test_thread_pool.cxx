@@ -227,12 +227,3 @@ TEST_F(ThreadPoolTest, TaskFullBuffer)
 
     EXPECT_EQ(counter_.load(), 16);
 }
-
-//------------------------------------------------------------------------------
-// main: typical Google Test entry
-//------------------------------------------------------------------------------
-int main(int argc, char **argv)
-{
-    ::testing::InitGoogleTest(&argc, argv);
-    return RUN_ALL_TESTS();
-}
\ No newline at end of file